@@ -1,8 +1,15 @@
-import math
-from collections import UserList
+from itertools import chain, islice, repeat
 
+__all__ = ['CyclicList']
 
-class CyclicList(UserList):
+_list_getitem = list.__getitem__
+_list_setitem = list.__setitem__
+_list_delitem = list.__delitem__
+_list_add = list.__add__
+_list_mul = list.__mul__
+
+
+class CyclicList(list):
     """
     A list that allows indices greater than its length by looping.
 
@@ -13,6 +20,13 @@ class CyclicList(UserList):
     def __init__(self, x):
         super().__init__(x)
 
+    @property
+    def data(self) -> list:
+        """
+        The list itself, kept for compatibility with the former `UserList` base. Indexing it also loops.
+        """
+        return self
+
     def __setitem__(self, key, value):
         """
         Sets `self[key]` to value.
@@ -26,12 +40,11 @@ class CyclicList(UserList):
             value:
 
         """
-        if isinstance(key, slice):
-            self.data[key] = value
-        elif key >= 0 and len(self) > 0:
-            self.data[key % len(self)] = value
-        else:
-            self.data[key] = value
+        if not isinstance(key, slice):
+            n = len(self)
+            if n and key >= n:
+                key = key - n if key < 2 * n else key % n
+        _list_setitem(self, key, value)
 
     def __getitem__(self, item):
         """
@@ -50,28 +63,35 @@ class CyclicList(UserList):
             corresponding element from the list.
 
         """
+        n = len(self)
         if isinstance(item, slice):
+            step = item.step
             start = 0 if item.start is None else item.start
-            stop = (len(self) if item.stop is None else item.stop) - 1
-            if start > stop:
+            stop = (n if item.stop is None else item.stop) - 1
+            if start > stop or n == 0:
                 return CyclicList([])
-            list_for_start = math.floor(start / len(self))
-            list_for_stop = math.floor(stop / len(self))
+            list_for_start, start = divmod(start, n)
+            list_for_stop, stop = divmod(stop, n)
             if list_for_stop == list_for_start:
-                return CyclicList(
-                    (self.data[start % len(self):stop % len(self)] + [self.data[stop % len(self)]])[::item.step]
-                )
+                if step is None or step > 0:
+                    return CyclicList(_list_getitem(self, slice(start, stop + 1, step)))
+                return CyclicList(_list_getitem(self, slice(start, stop + 1))[::step])
             entire_lists = max(0, list_for_stop - list_for_start - 1)
-            return CyclicList(
-                (self.data[start % len(self):]
-                 + entire_lists * self.data
-                 + self.data[:stop % len(self)]
-                 + [self.data[stop % len(self)]]
-                 )[::item.step]
-            )
-        if item >= 0 and len(self) > 0:
-            return self.data[item % len(self)]
-        return self.data[item]
+            if step is not None and step > 1:
+                # Only the elements selected by the step are copied, instead of every element of every lap
+                laps = chain(_list_getitem(self, slice(start, None)),
+                             chain.from_iterable(repeat(self, entire_lists)),
+                             _list_getitem(self, slice(stop + 1)))
+                return CyclicList(islice(laps, 0, None, step))
+            # The laps are appended in place to the result, instead of concatenating intermediate lists
+            looped = CyclicList(_list_getitem(self, slice(start, None)))
+            looped += _list_mul(self, entire_lists)
+            looped += _list_getitem(self, slice(stop + 1))
+            return looped if step is None or step == 1 else CyclicList(_list_getitem(looped, slice(None, None, step)))
+        # Indices up to `2 * n` are wrapped with a subtraction, only larger ones need the modulo
+        if n and item >= n:
+            item = item - n if item < 2 * n else item % n
+        return _list_getitem(self, item)
 
     def __delitem__(self, key):
         """
@@ -84,12 +104,56 @@ class CyclicList(UserList):
             key:
 
         """
-        if isinstance(key, slice):
-            del self.data[key]
-        elif key >= 0 and len(self) > 0:
-            del self.data[key % len(self)]
-        else:
-            del self.data[key]
+        if not isinstance(key, slice):
+            n = len(self)
+            if n and key >= n:
+                key = key - n if key < 2 * n else key % n
+        _list_delitem(self, key)
+
+    def __add__(self, other):
+        """
+        Returns the concatenation of `self` and `other` as a CyclicList.
+
+        Args:
+            other: An iterable to be concatenated after `self`.
+
+        """
+        return CyclicList(_list_add(self, other if isinstance(other, list) else list(other)))
+
+    def __radd__(self, other):
+        """
+        Returns the concatenation of `other` and `self` as a CyclicList.
+
+        Args:
+            other: An iterable to be concatenated before `self`.
+
+        """
+        return CyclicList(_list_add(other if isinstance(other, list) else list(other), self))
+
+    def __mul__(self, n):
+        """
+        Returns `self` repeated `n` times as a CyclicList.
+
+        Args:
+            n: The number of repetitions.
+
+        """
+        return CyclicList(_list_mul(self, n))
+
+    __rmul__ = __mul__
+
+    def __imul__(self, n):
+        """
+        Repeats `self` `n` times in place.
+
+        Args:
+            n: The number of repetitions.
+
+        """
+        return list.__imul__(self, n)
 
-    def __iter__(self):
-        return self.data.__iter__()
+    def copy(self):
+        """
+        Returns a shallow copy of `self` as a CyclicList.
+        """
+        return CyclicList(self)
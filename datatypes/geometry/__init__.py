@@ -1,2 +1,3 @@
 from .vector import *
 from .segment import *
+from .array import *
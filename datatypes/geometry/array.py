@@ -0,0 +1,260 @@
+from __future__ import annotations
+from itertools import chain
+
+import numpy as np
+
+from datatypes.geometry.vector import Point2D, Vector2D, Vector2DPolar
+
+__all__ = ['PointArray2D']
+
+_object_setattr = object.__setattr__
+
+
+class PointArray2D:
+    """
+    An array of 2-dimensional points.
+
+    A structure-of-arrays companion to `Point2D`: the x and y coordinates of all the points are stored in two
+    contiguous `np.ndarray` buffers, so arithmetic over every point is done by a couple of vectorized NumPy operations
+    instead of one Python call (and one new object) per point. `Point2D` and `Vector2D` remain the types for single
+    points and vectors, but bulk callers should use this form.
+
+    Args:
+        x: The x coordinates of the points.
+        y: The y coordinates of the points.
+    """
+
+    __slots__ = ['x', 'y']
+
+    # NumPy defers to the reflected operators of this class instead of broadcasting over it as an object
+    __array_ufunc__ = None
+
+    def __init__(self, x, y):
+        x = np.ascontiguousarray(x, dtype=np.float64)
+        y = np.ascontiguousarray(y, dtype=np.float64)
+        assert x.shape == y.shape
+        _object_setattr(self, 'x', x)
+        _object_setattr(self, 'y', y)
+
+    @classmethod
+    def from_points(cls, points) -> PointArray2D:
+        """
+        Builds an array from an iterable of points.
+
+        Args:
+            points: An iterable of `Point2D` or `Vector2DCartesian`.
+
+        Returns:
+            A `PointArray2D` with the coordinates of `points`, in the same order.
+        """
+        xy = np.fromiter(chain.from_iterable((p.x, p.y) for p in points), dtype=np.float64).reshape(-1, 2)
+        return cls(xy[:, 0], xy[:, 1])
+
+    @classmethod
+    def from_array(cls, xy) -> PointArray2D:
+        """
+        Builds an array from a NumPy array of coordinates.
+
+        Args:
+            xy: An array of shape `(N, 2)` with the coordinates `(x, y)` of a point in each row.
+
+        Returns:
+            A `PointArray2D` with the points of `xy`.
+        """
+        xy = np.asarray(xy, dtype=np.float64)
+        return cls(xy[:, 0], xy[:, 1])
+
+    def to_array(self) -> np.ndarray:
+        """
+        Passes `self` to a NumPy array of coordinates.
+
+        Returns:
+            An array of shape `(N, 2)` with the coordinates `(x, y)` of a point of `self` in each row.
+        """
+        return np.stack([self.x, self.y], axis=-1)
+
+    def to_list(self) -> list:
+        """
+        Passes `self` to a list format.
+
+        Returns:
+            A list with the list `[x, y]` of each point of `self`.
+        """
+        return self.to_array().tolist()
+
+    def to_points(self) -> list:
+        """
+        Passes `self` to a list of points.
+
+        Returns:
+            A list with a `Point2D` for each point of `self`.
+        """
+        return [Point2D(x, y) for x, y in zip(self.x.tolist(), self.y.tolist())]
+
+    def __len__(self):
+        return len(self.x)
+
+    def __eq__(self, other) -> bool:
+        """
+        Compares equality in two arrays of 2-dimensional points.
+
+        Returns True if all the coordinates of `self` and `other` are the same.
+
+        Args:
+            other: A `PointArray2D` to compare with.
+
+        Returns:
+            A `bool` value expressing equality between the arrays.
+        """
+        if not isinstance(other, PointArray2D):
+            return False
+        return np.array_equal(self.x, other.x) and np.array_equal(self.y, other.y)
+
+    def __neg__(self) -> PointArray2D:
+        return PointArray2D(-self.x, -self.y)
+
+    def __add__(self, other) -> PointArray2D:
+        """
+        Adds `self` to another array of points, a point or a vector.
+
+        If `other` is a `PointArray2D`, the points are added element-wise. If `other` is a `Point2D` or a `Vector2D`,
+        it is added to every point of `self`.
+
+        Args:
+            other: A `PointArray2D`, `Point2D` or `Vector2D` to be added to `self`.
+
+        Returns:
+            A `PointArray2D` with the sum of `self` and `other`.
+        """
+        coordinates = _coordinates(other)
+        if coordinates is None:
+            return NotImplemented
+        return PointArray2D(self.x + coordinates[0], self.y + coordinates[1])
+
+    def __radd__(self, other) -> PointArray2D:
+        return self + other
+
+    def __sub__(self, other) -> PointArray2D:
+        """
+        Substracts another array of points, a point or a vector to `self`.
+
+        If `other` is a `PointArray2D`, the points are substracted element-wise. If `other` is a `Point2D` or a
+        `Vector2D`, it is substracted to every point of `self`.
+
+        Args:
+            other: A `PointArray2D`, `Point2D` or `Vector2D` to be substracted to `self`.
+
+        Returns:
+            A `PointArray2D` with the substraction of `self` and `other`.
+        """
+        coordinates = _coordinates(other)
+        if coordinates is None:
+            return NotImplemented
+        return PointArray2D(self.x - coordinates[0], self.y - coordinates[1])
+
+    def __rsub__(self, other) -> PointArray2D:
+        # A vector minus a point is not defined, as for `Point2D`
+        if not isinstance(other, (Point2D, PointArray2D)):
+            return NotImplemented
+        return PointArray2D(other.x - self.x, other.y - self.y)
+
+    def __mul__(self, other) -> PointArray2D:
+        """
+        Multiplies `self` by a scalar or by an array of scalars.
+
+        Args:
+            other: A scalar, or an array of scalars broadcastable to `len(self)`, to multiply `self` by.
+
+        Returns:
+            A `PointArray2D` with the coordinates of `self` multiplied by `other`.
+        """
+        if np.asarray(other).dtype.kind not in 'biuf':
+            return NotImplemented
+        return PointArray2D(self.x * other, self.y * other)
+
+    def __rmul__(self, other) -> PointArray2D:
+        return self * other
+
+    def __truediv__(self, other) -> PointArray2D:
+        """
+        Divides `self` by a scalar or by an array of scalars.
+
+        Args:
+            other: A scalar, or an array of scalars broadcastable to `len(self)`, to divide `self` by.
+
+        Returns:
+            A `PointArray2D` with the coordinates of `self` divided by `other`.
+
+        Raises:
+            ZeroDivisionError: If `other` is, or contains, 0.
+        """
+        if np.asarray(other).dtype.kind not in 'biuf':
+            return NotImplemented
+        if np.any(np.equal(other, 0)):
+            raise ZeroDivisionError
+        return PointArray2D(self.x / other, self.y / other)
+
+    def dot(self, other) -> np.ndarray:
+        """
+        Computes the dot product of each point of `self`, taken as a vector, with `other`.
+
+        Args:
+            other: A `PointArray2D`, `Point2D` or `Vector2D` to compute the dot product with.
+
+        Returns:
+            An `np.ndarray` with the dot products.
+
+        Raises:
+            TypeError: If `other` is not a `PointArray2D`, `Point2D` or `Vector2D`.
+        """
+        coordinates = _coordinates(other)
+        if coordinates is None:
+            raise TypeError('Argument must be a PointArray2D, Point2D or Vector2D.')
+        return self.x * coordinates[0] + self.y * coordinates[1]
+
+    def rotate(self, angle) -> PointArray2D:
+        """
+        Rotates every point of `self`, taken as a vector, by `angle` radians.
+
+        Vectorized counterpart of `Vector2D.rotate`.
+
+        Args:
+            angle: An angle, or an array of angles broadcastable to `len(self)`, in radians.
+
+        Returns:
+            A `PointArray2D` with the points of `self` rotated counter-clockwise around the origin.
+        """
+        c, s = np.cos(angle), np.sin(angle)
+        x = c * self.x
+        x -= s * self.y
+        y = s * self.x
+        y += c * self.y
+        return PointArray2D(x, y)
+
+    def length(self) -> np.ndarray:
+        """
+        Returns the distance of each point of `self` to the origin.
+
+        Returns:
+            An `np.ndarray` with the magnitude of each point of `self`, taken as a vector.
+        """
+        return np.hypot(self.x, self.y)
+
+    def __setattr__(self, key, value):
+        raise TypeError('PointArray2D object is immutable.')
+
+    def __repr__(self):
+        return f'PointArray2D({len(self)} points)'
+
+    def __str__(self):
+        return self.__repr__()
+
+
+def _coordinates(other):
+    if isinstance(other, PointArray2D):
+        return other.x, other.y
+    if isinstance(other, Vector2DPolar):
+        other = other.to_cartesian()
+    if isinstance(other, (Point2D, Vector2D)):
+        return other.x, other.y
+    return None
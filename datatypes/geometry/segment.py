@@ -1,6 +1,13 @@
-from typing import Optional
+from math import hypot
+from typing import Optional, Tuple
 
-from datatypes.geometry import Point2D
+import numpy as np
+
+from datatypes.geometry.vector import Point2D
+
+__all__ = ['Segment2D']
+
+_object_setattr = object.__setattr__
 
 
 class Segment2D:
@@ -13,15 +20,15 @@ class Segment2D:
         a: The origin endpoint.
         b: The destination endpoint.
     """
-    __slots__ = ['a', 'b']
+    __slots__ = ['a', 'b', '_length']
 
     def __init__(self, a: Point2D, b: Point2D):
         self.a: Point2D
         self.b: Point2D
-        assert isinstance(a, Point2D)
-        assert isinstance(b, Point2D)
-        object.__setattr__(self, 'a', a)
-        object.__setattr__(self, 'b', b)
+        assert isinstance(a, Point2D) and isinstance(b, Point2D)
+        _object_setattr(self, 'a', a)
+        _object_setattr(self, 'b', b)
+        _object_setattr(self, '_length', -1.0)
 
     def length(self) -> float:
         """
@@ -31,7 +38,12 @@ class Segment2D:
             A `float` value corresponding to the distance between `self.a` and `self.b`.
 
         """
-        return (self.b - self.a).length()
+        # Segments are immutable, so the length is computed on the first call only
+        length = self._length
+        if length < 0:
+            length = hypot(self.b.x - self.a.x, self.b.y - self.a.y)
+            _object_setattr(self, '_length', length)
+        return length
 
     def intersection(self, other) -> Optional[Point2D]:
         """
@@ -47,16 +59,45 @@ class Segment2D:
         """
         if not isinstance(other, Segment2D):
             raise ValueError('Parameter must be a Segment.')
-        v1, v2 = (self.b - self.a).to_cartesian(), (other.b - other.a).to_cartesian()
-        denom: float = v1.y * v2.x - v1.x * v2.y
-        if denom == 0:
+        c, d = other.a, other.b
+        u = _intersection_parameter(self.a.x, self.a.y, self.b.x, self.b.y, c.x, c.y, d.x, d.y)
+        if u is None:
             return None
-        numer: float = v1.x * (other.a.y - self.a.y) - v1.y * (other.a.x - self.a.x)
-        u: float = numer / denom
-        t: float = (u * v2.x + other.a.x - self.a.x) / v1.x
-        if 0 <= u <= 1 and 0 <= t <= 1:
-            return other.a + u * v2
-        return None
+        return Point2D(c.x + u * (d.x - c.x), c.y + u * (d.y - c.y))
+
+    @classmethod
+    def batch_intersect(cls, a, b) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculates the intersections between many pairs of line segments at once.
+
+        Vectorized counterpart of `intersection` for bulk callers. Each segment is given as a row `(ax, ay, bx, by)`
+        of its endpoint coordinates, and the leading dimensions of `a` and `b` are broadcast against each other: two
+        `(N, 4)` arrays intersect the i-th segment of `a` with the i-th segment of `b`, while `a[:, None]` and
+        `b[None, :]` intersect every segment of `a` with every segment of `b`.
+
+        Args:
+            a: An array of shape `(..., 4)` with the first segment of each pair.
+            b: An array of shape `(..., 4)` with the second segment of each pair.
+
+        Returns:
+            A tuple `(mask, points)`, where `mask` is a boolean array with the broadcast shape `S` of the leading
+            dimensions, expressing whether each pair of segments intersects, and `points` is an array of shape
+            `S + (2,)` with the intersection points (`nan` for the pairs that do not intersect).
+        """
+        a = np.asarray(a, dtype=np.float64)
+        b = np.asarray(b, dtype=np.float64)
+        ax, ay, cx, cy = a[..., 0], a[..., 1], b[..., 0], b[..., 1]
+        v1x, v1y = a[..., 2] - ax, a[..., 3] - ay
+        v2x, v2y = b[..., 2] - cx, b[..., 3] - cy
+        denom = v1y * v2x - v1x * v2y
+        with np.errstate(divide='ignore', invalid='ignore'):
+            u = (v1x * (cy - ay) - v1y * (cx - ax)) / denom
+            t = np.where(v1x != 0, (u * v2x + cx - ax) / v1x, (u * v2y + cy - ay) / v1y)
+            # `u` is infinite or `nan` for parallel segments, those points are discarded by the mask
+            points = np.stack([cx + u * v2x, cy + u * v2y], axis=-1)
+        mask = (denom != 0) & (0 <= u) & (u <= 1) & (0 <= t) & (t <= 1)
+        points = np.where(mask[..., None], points, np.nan)
+        return mask, points
 
     def intersects_with(self, other) -> bool:
         """
@@ -70,7 +111,43 @@ class Segment2D:
         Returns:
             A `bool` value expressing whether there exists an intersection point between `self` and `other`.
         """
-        return self.intersection(other) is not None
+        if not isinstance(other, Segment2D):
+            raise ValueError('Parameter must be a Segment.')
+        c, d = other.a, other.b
+        return _intersection_parameter(self.a.x, self.a.y, self.b.x, self.b.y, c.x, c.y, d.x, d.y) is not None
+
+    def intersection_many(self, others) -> np.ndarray:
+        """
+        Calculates the intersections between `self` and many line segments at once.
+
+        Vectorized counterpart of `intersection`, through `batch_intersect`.
+
+        Args:
+            others: An array of shape `(..., 4)` with a segment `(ax, ay, bx, by)` in each row.
+
+        Returns:
+            An array of shape `others.shape[:-1] + (2,)` with the intersection point between `self` and each segment
+            of `others` (`nan` for the segments that do not intersect with `self`).
+        """
+        return self.batch_intersect(self._to_row(), others)[1]
+
+    def intersects_many(self, others) -> np.ndarray:
+        """
+        Checks whether `self` intersects with many line segments at once.
+
+        Vectorized counterpart of `intersects_with`, through `batch_intersect`.
+
+        Args:
+            others: An array of shape `(..., 4)` with a segment `(ax, ay, bx, by)` in each row.
+
+        Returns:
+            A boolean array of shape `others.shape[:-1]` expressing whether `self` intersects with each segment of
+            `others`.
+        """
+        return self.batch_intersect(self._to_row(), others)[0]
+
+    def _to_row(self) -> np.ndarray:
+        return np.array([self.a.x, self.a.y, self.b.x, self.b.y], dtype=np.float64)
 
     def __eq__(self, other):
         """
@@ -95,4 +172,19 @@ class Segment2D:
         return f'{self.a}->{self.b}'
 
     def __str__(self):
-        return self.__repr__()
\ No newline at end of file
+        return self.__repr__()
+
+
+def _intersection_parameter(ax, ay, bx, by, cx, cy, dx, dy) -> Optional[float]:
+    # Position, between 0 and 1, of the intersection of segments ab and cd along cd, or None if there is none
+    v1x, v1y = bx - ax, by - ay
+    v2x, v2y = dx - cx, dy - cy
+    denom: float = v1y * v2x - v1x * v2y
+    if denom == 0:
+        return None
+    u: float = (v1x * (cy - ay) - v1y * (cx - ax)) / denom
+    # A non-zero `denom` guarantees that `v1x` and `v1y` are not both 0
+    t: float = (u * v2x + cx - ax) / v1x if v1x != 0 else (u * v2y + cy - ay) / v1y
+    if 0 <= u <= 1 and 0 <= t <= 1:
+        return u
+    return None
@@ -1,12 +1,17 @@
 from __future__ import annotations
 from abc import abstractmethod
-from math import tau, pi, sqrt
+from math import tau, pi, cos, sin, atan2, hypot
 from typing import Union
 
 import numpy as np
 
+__all__ = ['Point2D', 'Vector2D', 'Vector2DCartesian', 'Vector2DPolar']
 
-def normalize_t(t): return t % tau
+_SCALAR = (int, float, np.integer, np.floating)
+_object_setattr = object.__setattr__
+_HALF_PI = pi/2
+_THREE_HALVES_PI = 3*pi/2
+_TWO_TAU = 2*tau
 
 
 class Point2D:
@@ -23,12 +28,9 @@ class Point2D:
     __slots__ = ['x', 'y']
 
     def __init__(self, x, y):
-        assert x is not None
-        assert y is not None
-        assert np.isreal(x)
-        assert np.isreal(y)
-        object.__setattr__(self, 'x', x)
-        object.__setattr__(self, 'y', y)
+        assert isinstance(x, _SCALAR) and isinstance(y, _SCALAR)
+        _object_setattr(self, 'x', x)
+        _object_setattr(self, 'y', y)
 
     def __eq__(self, other) -> bool:
         """
@@ -73,12 +75,14 @@ class Point2D:
         Raises:
             TypeError: If `other` is not a `Point2D` or `Vector2D`.
         """
-        if not isinstance(other, Point2D) \
-                and not isinstance(other, Vector2D):
-            return NotImplemented
-        if isinstance(other, Vector2DPolar):
+        kind = type(other)
+        if kind is Point2D or kind is Vector2DCartesian:
+            return Point2D(self.x + other.x, self.y + other.y)
+        if not isinstance(other, Point2D):
+            if not isinstance(other, Vector2D):
+                return NotImplemented
             other = other.to_cartesian()
-        return Point2D(x=self.x + other.x, y=self.y + other.y)
+        return Point2D(self.x + other.x, self.y + other.y)
 
     def __sub__(self, other) -> Union[Point2D, Vector2D]:
         """
@@ -97,14 +101,17 @@ class Point2D:
             TypeError: If `other` is not a `Point2D` or `Vector2D`.
 
         """
-        if not isinstance(other, Point2D) \
-                and not isinstance(other, Vector2D):
-            return NotImplemented
+        kind = type(other)
+        if kind is Point2D:
+            return Vector2DCartesian(self.x - other.x, self.y - other.y)
+        if kind is Vector2DCartesian:
+            return Point2D(self.x - other.x, self.y - other.y)
         if isinstance(other, Point2D):
-            return Vector2D(x=self.x - other.x, y=self.y - other.y)
-        if isinstance(other, Vector2DPolar):
-            other = other.to_cartesian()
-        return Point2D(x=self.x - other.x, y=self.y - other.y)
+            return Vector2DCartesian(self.x - other.x, self.y - other.y)
+        if not isinstance(other, Vector2D):
+            return NotImplemented
+        other = other.to_cartesian()
+        return Point2D(self.x - other.x, self.y - other.y)
 
     def __mul__(self, other) -> Point2D:
         """
@@ -119,10 +126,10 @@ class Point2D:
         Raises:
             TypeError: If `other` is not a scalar.
         """
-        if not np.isreal(other):
+        if not isinstance(other, _SCALAR):
             return NotImplemented
         if other == 0:
-            return Point2D(x=0, y=0)
+            return _ZERO_POINT
         return Point2D(self.x*other, self.y*other)
 
     def __rmul__(self, other) -> Point2D:
@@ -142,7 +149,7 @@ class Point2D:
             TypeError: If `other` is not a scalar.
             ZeroDivisionError: If `other` is equal to 0.
         """
-        if not np.isreal(other):
+        if not isinstance(other, _SCALAR):
             return NotImplemented
         if other == 0:
             raise ZeroDivisionError
@@ -169,7 +176,28 @@ class Point2D:
         return self.__str__()
 
 
-class Vector2D:
+class _Vector2DMeta(type):
+    # Calling `Vector2D` itself dispatches on the given arguments to the concrete form of the vector, any other
+    # subclass is instantiated as usual
+    def __call__(cls, *args, **kwargs):
+        if cls is not Vector2D:
+            return super().__call__(*args, **kwargs)
+        return _new_vector(*args, **kwargs)
+
+
+def _new_vector(x=None, y=None, r=None, t=None) -> Vector2D:
+    assert ((x is not None and y is not None) or (r is not None and t is not None))
+    if x is not None and y is not None:
+        return Vector2DCartesian(x, y)
+    return Vector2DPolar(r, t)
+
+
+class _ConcreteVector2DMeta(_Vector2DMeta):
+    # The concrete forms are instantiated directly, without any Python-level dispatch
+    __call__ = type.__call__
+
+
+class Vector2D(metaclass=_Vector2DMeta):
     """
     A 2-dimensional vector.
 
@@ -183,15 +211,35 @@ class Vector2D:
         t: The orientation of the vector, in radians (polar form).
     """
 
-    def __new__(cls, x=None, y=None, r=None, t=None):
-        if cls is Vector2D:
-            assert ((x is not None and y is not None) or (r is not None and t is not None))
-            if x is not None and y is not None:
-                return Vector2DCartesian(x, y)
-            elif r is not None and t is not None:
-                return Vector2DPolar(r, t)
-        else:
-            return object.__new__(cls)
+    __slots__ = ()
+
+    @classmethod
+    def cartesian(cls, x, y) -> Vector2DCartesian:
+        """
+        Creates a vector in cartesian form.
+
+        Args:
+            x: The x coordinate of the vector.
+            y: The y coordinate of the vector.
+
+        Returns:
+            A `Vector2DCartesian` with coordinates `x` and `y`.
+        """
+        return Vector2DCartesian(x, y)
+
+    @classmethod
+    def polar(cls, r, t) -> Vector2DPolar:
+        """
+        Creates a vector in polar form.
+
+        Args:
+            r: The length of the vector.
+            t: The orientation of the vector, in radians.
+
+        Returns:
+            A `Vector2DPolar` with length `r` and orientation `t`.
+        """
+        return Vector2DPolar(r, t)
 
     @abstractmethod
     def __eq__(self, other) -> bool:
@@ -379,20 +427,18 @@ class Vector2D:
     def __repr__(self) -> str: pass
 
 
-class Vector2DCartesian(Vector2D):
+class Vector2DCartesian(Vector2D, metaclass=_ConcreteVector2DMeta):
 
     __slots__ = ['x', 'y']
 
     def __init__(self, x, y):
-        super().__init__()
-        assert np.isreal(x)
-        assert np.isreal(y)
-        object.__setattr__(self, 'x', x)
-        object.__setattr__(self, 'y', y)
+        assert isinstance(x, _SCALAR) and isinstance(y, _SCALAR)
+        _object_setattr(self, 'x', x)
+        _object_setattr(self, 'y', y)
 
     def to_cartesian(self) -> Vector2DCartesian: return self
 
-    def to_polar(self) -> Vector2DPolar: return Vector2DPolar(self.length(), np.arctan2(self.y, self.x))
+    def to_polar(self) -> Vector2DPolar: return Vector2DPolar(self.length(), atan2(self.y, self.x))
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Vector2D):
@@ -400,80 +446,98 @@ class Vector2DCartesian(Vector2D):
         other = other.to_cartesian()
         return self.x == other.x and self.y == other.y
 
-    def length(self) -> float: return sqrt(self.x*self.x + self.y*self.y)
+    def length(self) -> float: return hypot(self.x, self.y)
 
     def __neg__(self): return Vector2DCartesian(-self.x, -self.y)
 
     def __add__(self, other: Union[Vector2D, Point2D]) -> Union[Vector2DCartesian, Point2D]:
+        # Exact type check first, as adding two cartesian vectors is by far the most common case
+        if type(other) is Vector2DCartesian:
+            return Vector2DCartesian(self.x + other.x, self.y + other.y)
         if isinstance(other, Point2D):
             return other + self
         if not isinstance(other, Vector2D):
             return NotImplemented
-        if isinstance(other, Vector2DPolar):
-            other = other.to_cartesian()
+        other = other.to_cartesian()
         return Vector2DCartesian(self.x + other.x, self.y + other.y)
 
     def __sub__(self, other: Vector2D) -> Vector2D:
+        if type(other) is Vector2DCartesian:
+            return Vector2DCartesian(self.x - other.x, self.y - other.y)
         if not isinstance(other, Vector2D):
             return NotImplemented
-        if isinstance(other, Vector2DPolar):
-            other = other.to_cartesian()
+        other = other.to_cartesian()
         return Vector2DCartesian(self.x - other.x, self.y - other.y)
 
     def __mul__(self, other) -> Vector2DCartesian:
-        if not np.isreal(other):
+        if not isinstance(other, _SCALAR):
             return NotImplemented
         if other == 0:
-            return Vector2D(x=0, y=0)
+            return _ZERO_VECTOR
         return Vector2DCartesian(self.x*other, self.y*other)
 
     def __truediv__(self, other) -> Vector2DCartesian:
-        if not np.isreal(other):
+        if not isinstance(other, _SCALAR):
             return NotImplemented
         if other == 0:
             raise ZeroDivisionError
         return Vector2DCartesian(self.x/other, self.y/other)
 
     def angle_with(self, other):
-        if not np.isreal(other):
+        if not isinstance(other, Vector2D):
             raise TypeError('Argument must be a Vector2D.')
-        return self.to_polar().angle_with(other)
+        t, other_t = _orientation(self), _orientation(other)
+        return min((t-other_t) % tau, (other_t-t) % tau)
 
-    def unit(self): return (self / self.length()) if self.length() != 0 else self
+    def unit(self):
+        length = hypot(self.x, self.y)
+        return Vector2DCartesian(self.x/length, self.y/length) if length != 0 else self
 
     def rotate(self, angle:float) -> Vector2D:
-        if normalize_t(angle) == 0:
+        n = angle % tau
+        if n == 0:
             return self
-        if normalize_t(angle) == pi/2:
+        if n == _HALF_PI:
             return Vector2DCartesian(-self.y, self.x)
-        if normalize_t(angle) == pi:
+        if n == pi:
             return -self
-        if normalize_t(angle) == 3*pi/2:
+        if n == _THREE_HALVES_PI:
             return Vector2DCartesian(self.y, -self.x)
-        return self.to_polar().rotate(angle)
+        c, s = cos(angle), sin(angle)
+        return Vector2DCartesian(c*self.x - s*self.y, s*self.x + c*self.y)
 
     def __repr__(self): return f'<{self.x:.2f},{self.y:.2f}>'
 
     def __str__(self): return self.__repr__()
 
 
-class Vector2DPolar(Vector2D):
+class Vector2DPolar(Vector2D, metaclass=_ConcreteVector2DMeta):
 
-    __slots__ = ['r', 't']
+    __slots__ = ['r', 't', '_cartesian']
 
     def __init__(self, r, t):
-        super().__init__()
-        assert np.isreal(r)
-        assert np.isreal(t)
+        assert isinstance(r, _SCALAR) and isinstance(t, _SCALAR)
         if r < 0:
-            object.__setattr__(self, 'r', -r)
-            object.__setattr__(self, 't', normalize_t(t+pi) if r != 0 else 0)
-        else:
-            object.__setattr__(self, 'r', r)
-            object.__setattr__(self, 't', normalize_t(t) if r != 0 else 0)
+            r, t = -r, t+pi
+        # The orientation is reduced to [0, tau) here, so the methods below can pass it unnormalized
+        if r == 0:
+            t = 0
+        elif t >= tau:
+            # Orientations off by a single turn, like those of `__neg__` and `rotate`, only need a subtraction
+            t = t - tau if t < _TWO_TAU else t % tau
+        elif t < 0:
+            t = t + tau if t >= -tau else t % tau
+        _object_setattr(self, 'r', r)
+        _object_setattr(self, 't', t)
+        _object_setattr(self, '_cartesian', None)
 
     def to_cartesian(self) -> Vector2DCartesian:
-        return Vector2DCartesian(self.r * np.cos(self.t), self.r * np.sin(self.t))
+        # Vectors are immutable, so the cartesian form is computed only once
+        cartesian = self._cartesian
+        if cartesian is None:
+            cartesian = Vector2DCartesian(self.r * cos(self.t), self.r * sin(self.t))
+            _object_setattr(self, '_cartesian', cartesian)
+        return cartesian
 
     def to_polar(self) -> Vector2DPolar: return self
 
@@ -485,7 +549,7 @@ class Vector2DPolar(Vector2D):
 
     def length(self) -> float: return self.r
 
-    def __neg__(self): return Vector2DPolar(self.r, normalize_t(self.t+pi))
+    def __neg__(self): return Vector2DPolar(self.r, self.t+pi)
 
     def __add__(self, other: Union[Vector2D, Point2D]) -> Union[Vector2D, Point2D]:
         if isinstance(other, Point2D):
@@ -502,34 +566,50 @@ class Vector2DPolar(Vector2D):
         if isinstance(other, Vector2DPolar) and self.t == other.t:
             return Vector2DPolar(self.r - other.r, self.t) \
                 if self.r >= other.r \
-                else Vector2DPolar(other.r - self.r, normalize_t(self.t+pi))
+                else Vector2DPolar(other.r - self.r, self.t+pi)
         return self.to_cartesian() - other.to_cartesian()
 
     def __mul__(self, other) -> Vector2D:
-        if not np.isreal(other):
+        if not isinstance(other, _SCALAR):
             return NotImplemented
         if other == 0:
-            return Vector2D(x=0, y=0)
+            # The orientation of a null vector is undefined, so the cartesian zero vector is returned
+            return _ZERO_VECTOR
         return Vector2DPolar(self.r*other, self.t)
 
     def __truediv__(self, other) -> Vector2DPolar:
-        if not np.isreal(other):
+        if not isinstance(other, _SCALAR):
             return NotImplemented
         if other == 0:
             raise ZeroDivisionError
         return Vector2DPolar(self.r/other, self.t)
 
     def angle_with(self, other):
-        if not np.isreal(other):
+        if not isinstance(other, Vector2D):
             raise TypeError('Argument must be a Vector2D.')
-        if isinstance(other, Vector2DCartesian):
-            other = other.to_polar()
-        return min(normalize_t(self.t-other.t), normalize_t(other.t-self.t))
+        other_t = _orientation(other)
+        return min((self.t-other_t) % tau, (other_t-self.t) % tau)
 
     def unit(self): return Vector2DPolar(1, self.t)
 
-    def rotate(self, angle: float): return Vector2DPolar(self.r, normalize_t(self.t + angle))
+    def rotate(self, angle: float): return Vector2DPolar(self.r, self.t + angle)
 
     def __repr__(self): return f'<{self.r:.2f}, {self.t:.2f} rad>'
 
-    def __str__(self): return self.__repr__()
\ No newline at end of file
+    def __str__(self): return self.__repr__()
+
+
+def _orientation(vector: Vector2D) -> float:
+    # Same value as `vector.to_polar().t`, without building the polar vector
+    if isinstance(vector, Vector2DPolar):
+        return vector.t
+    x, y = vector.x, vector.y
+    # Zero vectors have orientation 0, as in `Vector2DPolar`, whatever the signs of their zeros
+    if x == 0 and y == 0:
+        return 0
+    return atan2(y, x) % tau
+
+
+# Immutable results shared by every multiplication by 0
+_ZERO_POINT = Point2D(0, 0)
+_ZERO_VECTOR = Vector2DCartesian(0, 0)
@@ -0,0 +1,110 @@
+from math import pi
+from unittest import TestCase
+
+import numpy as np
+
+from datatypes.geometry import PointArray2D, Point2D, Vector2D
+
+
+class TestPointArray2D(TestCase):
+    def test_init(self):
+        a = PointArray2D([0, 1, 2], [3, 4, 5])
+        self.assertEqual(type(a), PointArray2D)
+        self.assertEqual(a.x.dtype, np.float64)
+        self.assertEqual([a.x.tolist(), a.y.tolist()], [[0, 1, 2], [3, 4, 5]])
+        self.assertEqual(len(a), 3)
+        self.assertFalse(hasattr(a, '__dict__'))
+
+    def test_from_points(self):
+        points = [Point2D(0, 3), Point2D(1, 4), Point2D(2, 5)]
+        a = PointArray2D.from_points(points)
+        self.assertEqual(a, PointArray2D([0, 1, 2], [3, 4, 5]))
+        self.assertEqual(a.to_points(), points)
+        self.assertEqual(len(PointArray2D.from_points([])), 0)
+
+    def test_eq(self):
+        a = PointArray2D([0, 1], [2, 3])
+        b = PointArray2D([0, 1], [2, 3])
+        c = PointArray2D([0, 1], [2, 4])
+        self.assertEqual(a == b, True)
+        self.assertEqual(a == c, False)
+
+    def test_add(self):
+        a = PointArray2D([0, 1], [2, 3])
+        b = PointArray2D([4, 5], [6, 7])
+        self.assertEqual(a + b, PointArray2D([4, 6], [8, 10]))
+        v = Vector2D(4, -3)
+        self.assertEqual(a + v, PointArray2D([4, 5], [-1, 0]))
+        self.assertEqual(v + a, PointArray2D([4, 5], [-1, 0]))
+        self.assertEqual(Point2D(1, 1) + a, PointArray2D([1, 2], [3, 4]))
+        w = Vector2D(r=3, t=pi/2)
+        self.assertAlmostEqual(np.abs((a + w - PointArray2D([0, 1], [5, 6])).length()).max(), 0)
+
+    def test_sub(self):
+        a = PointArray2D([0, 1], [2, 3])
+        b = PointArray2D([4, 5], [6, 7])
+        self.assertEqual(b - a, PointArray2D([4, 4], [4, 4]))
+        self.assertEqual(a - Vector2D(1, 1), PointArray2D([-1, 0], [1, 2]))
+        self.assertEqual(Point2D(1, 1) - a, PointArray2D([1, 0], [-1, -2]))
+        with self.assertRaises(TypeError):
+            Vector2D(1, 1) - a
+        with self.assertRaises(TypeError):
+            Vector2D(r=1, t=0) - a
+
+    def test_mul(self):
+        a = PointArray2D([0, 1], [2, 3])
+        self.assertEqual(a * 3, PointArray2D([0, 3], [6, 9]))
+        self.assertEqual(0.5 * a, PointArray2D([0, 0.5], [1, 1.5]))
+        self.assertEqual(a * np.array([2, 0]), PointArray2D([0, 0], [4, 0]))
+        self.assertEqual(np.array([2, 0]) * a, PointArray2D([0, 0], [4, 0]))
+        self.assertEqual(np.float64(2) * a, PointArray2D([0, 2], [4, 6]))
+        with self.assertRaises(TypeError):
+            np.array([1., 2.]) + a
+        with self.assertRaises(TypeError):
+            a + np.array([1., 2.])
+
+    def test_div(self):
+        a = PointArray2D([0, 1], [2, 3])
+        self.assertEqual(a / 2, PointArray2D([0, 0.5], [1, 1.5]))
+        self.assertEqual(a / np.array([1, 4]), PointArray2D([0, 0.25], [2, 0.75]))
+        with self.assertRaises(ZeroDivisionError):
+            a / 0
+        with self.assertRaises(ZeroDivisionError):
+            a / np.array([1, 0])
+
+    def test_to_list(self):
+        a = PointArray2D([0, 1], [2, 3])
+        self.assertEqual(a.to_list(), [p.to_list() for p in a.to_points()])
+
+    def test_dot(self):
+        a = PointArray2D([1, 0], [2, 3])
+        self.assertEqual(a.dot(Vector2D(x=2, y=1)).tolist(), [4, 3])
+        self.assertEqual(a.dot(a).tolist(), [5, 9])
+
+    def test_length(self):
+        a = PointArray2D([3, 0], [4, 2])
+        self.assertEqual(a.length().tolist(), [5, 2])
+
+    def test_array(self):
+        xy = np.array([[0, 3], [1, 4], [2, 5]])
+        a = PointArray2D.from_array(xy)
+        self.assertEqual(a, PointArray2D([0, 1, 2], [3, 4, 5]))
+        self.assertEqual(a.to_array().tolist(), xy.tolist())
+
+    def test_rotate(self):
+        a = PointArray2D([3, 1, 0], [4, 0, -2])
+        self.assertAlmostEqual(np.abs((a.rotate(pi/2) - PointArray2D([-4, 0, 2], [3, 1, 0])).length()).max(), 0)
+        angles = np.array([0, pi, 3])
+        vectors = [Vector2D(x=3, y=4), Vector2D(x=1, y=0), Vector2D(x=0, y=-2)]
+        rotated = a.rotate(angles).to_points()
+        for p, v, angle in zip(rotated, vectors, angles):
+            self.assertAlmostEqual((p - Point2D(0, 0) - v.rotate(angle)).length(), 0)
+
+    def test_matches_scalar(self):
+        points = [Point2D(2, 3), Point2D(-1, 0.5), Point2D(0, 0), Point2D(7, -2)]
+        a = PointArray2D.from_points(points)
+        v = Vector2D(x=4, y=-3)
+        self.assertEqual((a + v).to_points(), [p + v for p in points])
+        self.assertEqual((a - v).to_points(), [p - v for p in points])
+        self.assertEqual((a * 0.4).to_points(), [p * 0.4 for p in points])
+        self.assertEqual((a / 3).to_points(), [p / 3 for p in points])
@@ -8,6 +8,26 @@ class TestCyclicList(TestCase):
         self.assertEqual(type(cl), CyclicList)
         self.assertEqual(cl.data, [1, 2, 3, 4, 5])
 
+    def test_operations(self):
+        cl = CyclicList([0, 1, 2])
+        for result in [cl + [3], [3] + cl, cl + (3,), cl * 2, 2 * cl, cl.copy()]:
+            self.assertEqual(type(result), CyclicList)
+        self.assertEqual(cl + [3], CyclicList([0, 1, 2, 3]))
+        self.assertEqual([3] + cl, CyclicList([3, 0, 1, 2]))
+        self.assertEqual((cl + [3])[7], 3)
+        self.assertEqual(cl * 2, CyclicList([0, 1, 2, 0, 1, 2]))
+        copy = cl.copy()
+        copy[4] = '4'
+        self.assertEqual([copy, cl], [CyclicList([0, '4', 2]), CyclicList([0, 1, 2])])
+        # In-place operations modify the list itself
+        alias = cl
+        cl *= 2
+        self.assertIs(cl, alias)
+        self.assertEqual(alias, CyclicList([0, 1, 2, 0, 1, 2]))
+        cl += [3]
+        self.assertIs(cl, alias)
+        self.assertEqual(alias, CyclicList([0, 1, 2, 0, 1, 2, 3]))
+
     def test_set(self):
         cl = CyclicList([0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
         # Setting an element
@@ -34,6 +54,28 @@ class TestCyclicList(TestCase):
         self.assertEqual(cl[:23], CyclicList(2 * cl.data + [0, 1, 2]))
         self.assertEqual(cl[-12:23], CyclicList([8, 9] + 3 * cl.data + [0, 1, 2]))
         self.assertEqual(cl[-12:], CyclicList([8, 9] + 2 * cl.data))
+        self.assertEqual(CyclicList([])[2:5], CyclicList([]))
+        # Getting a stepped looped slice
+        self.assertEqual(cl[-12:23:3], CyclicList(([8, 9] + 3 * cl.data + [0, 1, 2])[::3]))
+        self.assertEqual(cl[2:23:-1], CyclicList(([2, 3, 4, 5, 6, 7, 8, 9] + cl.data + [0, 1, 2])[::-1]))
+
+    def test_wrap_boundaries(self):
+        cl = CyclicList([0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
+        # Indices around one and two laps, wrapped by subtraction or by modulo
+        self.assertEqual([cl[9], cl[10], cl[19], cl[20], cl[1234]], [9, 0, 9, 0, 4])
+        self.assertEqual([cl[-1], cl[-10]], [9, 0])
+        with self.assertRaises(IndexError):
+            cl[-11]
+        cl[10] = '10'
+        cl[19] = '19'
+        cl[20] = '20'
+        self.assertEqual(cl, CyclicList(['20', 1, 2, 3, 4, 5, 6, 7, 8, '19']))
+        del cl[19]
+        del cl[17]
+        del cl[16]
+        self.assertEqual(cl, CyclicList([1, 2, 3, 4, 5, 6, 7]))
+        with self.assertRaises(IndexError):
+            CyclicList([])[3]
 
     def test_del(self):
         cl = CyclicList([0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
@@ -44,6 +86,9 @@ class TestCyclicList(TestCase):
         # Deleting a slice
         del cl[5:40]
         self.assertEqual(cl, CyclicList([0, 1, 3, 4, 5]))
+        # Deleting a stepped slice, in a single list operation
+        del cl[::2]
+        self.assertEqual(cl, CyclicList([1, 4]))
 
     def test_iter(self):
         cl = CyclicList([0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
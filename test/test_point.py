@@ -7,6 +7,7 @@ class TestPoint2D(TestCase):
     def test_init(self):
         p = Point2D(2, 3)
         self.assertEqual([type(p), p.x, p.y], [Point2D, 2, 3])
+        self.assertFalse(hasattr(p, '__dict__'))
 
     def test_eq(self):
         p = Point2D(2, 3)
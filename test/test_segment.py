@@ -1,4 +1,5 @@
 from math import pi, tau, sqrt
+import warnings
 from unittest import TestCase
 
 import numpy as np
@@ -10,6 +11,7 @@ class TestSegment2D(TestCase):
     def test_init(self):
         s = Segment2D(Point2D(0, 0), Point2D(4, 3))
         self.assertEqual([type(s), s.a, s.b], [Segment2D, Point2D(0, 0), Point2D(4, 3)])
+        self.assertFalse(hasattr(s, '__dict__'))
 
     def test_eq(self):
         s = Segment2D(Point2D(0, 0), Point2D(4, 3))
@@ -21,6 +23,10 @@ class TestSegment2D(TestCase):
     def test_length(self):
         s = Segment2D(Point2D(0, 0), Point2D(4, 3))
         self.assertEqual(s.length(), 5)
+        # Second call, with the cached length
+        self.assertEqual(s.length(), 5)
+        s = Segment2D(Point2D(-3e200, 0), Point2D(0, 4e200))
+        self.assertAlmostEqual(s.length() / 5e200, 1)
 
     def test_intersects_with(self):
         s = Segment2D(Point2D(0, 0), Point2D(3, 3))
@@ -32,6 +38,8 @@ class TestSegment2D(TestCase):
         self.assertEqual(s.intersects_with(u), True)
         self.assertEqual(s.intersects_with(v), True)
         self.assertEqual(s.intersects_with(w), False)
+        others = np.array([[2, 0, 2, 3], [0, 0, 2, 3], [6, 0, 3, 3], [10, 10, 15, 15]])
+        self.assertEqual(s.intersects_many(others).tolist(), [True, True, True, False])
 
     def test_intersection(self):
         s = Segment2D(Point2D(0, 0), Point2D(3, 3))
@@ -43,4 +51,41 @@ class TestSegment2D(TestCase):
         self.assertEqual(s.intersection(u), Point2D(0, 0))
         self.assertEqual(s.intersection(v), Point2D(3, 3))
         self.assertEqual(s.intersection(w), None)
+        self.assertEqual(t.intersection(s), Point2D(2, 2))
+        others = np.array([[2, 0, 2, 3], [0, 0, 2, 3], [6, 0, 3, 3], [10, 10, 15, 15]])
+        points = s.intersection_many(others)
+        self.assertEqual(points[:3].tolist(), [[2, 2], [0, 0], [3, 3]])
+        self.assertTrue(np.isnan(points[3]).all())
 
+    def test_batch_intersect(self):
+        s = Segment2D(Point2D(0, 0), Point2D(3, 3))
+        others = [
+            Segment2D(Point2D(2, 0), Point2D(2, 3)),
+            Segment2D(Point2D(0, 0), Point2D(2, 3)),
+            Segment2D(Point2D(6, 0), Point2D(3, 3)),
+            Segment2D(Point2D(10, 10), Point2D(15, 15)),
+            Segment2D(Point2D(-1, -1), Point2D(4, 4)),
+        ]
+        a = np.array([[s.a.x, s.a.y, s.b.x, s.b.y]] * len(others))
+        b = np.array([[o.a.x, o.a.y, o.b.x, o.b.y] for o in others])
+        mask, points = Segment2D.batch_intersect(a, b)
+        self.assertEqual(mask.tolist(), [s.intersects_with(o) for o in others])
+        self.assertEqual(points[:3].tolist(), [s.intersection(o).to_list() for o in others[:3]])
+        self.assertTrue(np.isnan(points[3:]).all())
+        mask, points = Segment2D.batch_intersect(b[:1], a[:1])
+        self.assertEqual([mask.tolist(), points.tolist()], [[True], [[2, 2]]])
+        # All-vs-all intersection by broadcasting
+        mask, points = Segment2D.batch_intersect(b[:, None], b[None, :])
+        self.assertEqual(mask.shape, (len(others), len(others)))
+        self.assertEqual(points.shape, (len(others), len(others), 2))
+        self.assertEqual(mask.tolist(), [[o.intersects_with(p) for p in others] for o in others])
+        self.assertEqual(points[1, 0].tolist(), others[1].intersection(others[0]).to_list())
+        # Parallel segments that are not collinear do not intersect, and no warning is emitted
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            mask, points = Segment2D.batch_intersect([[0, 0, 0, 1.]], [[1, 0, 1, 1.]])
+            self.assertEqual(mask.tolist(), [False])
+            self.assertTrue(np.isnan(points).all())
+            segment = Segment2D(Point2D(0, 0), Point2D(0, 1))
+            self.assertEqual(segment.intersects_many([[1, 0, 1, 1]]).tolist(), [False])
+            self.assertTrue(np.isnan(segment.intersection_many([[1, 0, 1, 1]])).all())
@@ -16,6 +16,23 @@ class TestVector2D(TestCase):
         self.assertEqual([type(w), w.x, w.y], [Vector2DCartesian, 2, 3])
         self.assertEqual([type(z), z.r, z.t], [Vector2DPolar, 2, 3])
         self.assertEqual([type(u), u.r, u.t], [Vector2DPolar, 0, 0])
+        self.assertFalse(hasattr(v, '__dict__') or hasattr(z, '__dict__'))
+        for t in [-1, -tau, -3*tau - 1, tau, tau + 3, 5*tau + 1]:
+            self.assertEqual(Vector2D(r=2, t=t).t, t % tau)
+        v = Vector2D.cartesian(2, 3)
+        z = Vector2D.polar(-2, 3)
+        self.assertEqual([type(v), v.x, v.y], [Vector2DCartesian, 2, 3])
+        self.assertEqual([type(z), z.r, z.t], [Vector2DPolar, 2, (3+pi) % tau])
+
+    def test_subclass(self):
+        class ScaledVector2D(Vector2D):
+            def __init__(self, k):
+                object.__setattr__(self, 'k', k)
+
+        v = ScaledVector2D(5)
+        self.assertEqual([type(v), v.k], [ScaledVector2D, 5])
+        v = ScaledVector2D(k=5)
+        self.assertEqual([type(v), v.k], [ScaledVector2D, 5])
 
     def test_eq(self):
         v = Vector2D(x=2, y=3)
@@ -31,13 +48,18 @@ class TestVector2D(TestCase):
         self.assertEqual(v.length(), sqrt(13))
         self.assertEqual(w.length(), 5)
         self.assertEqual(z.length(), 2)
+        # No overflow or underflow in the intermediate squares
+        self.assertAlmostEqual(Vector2D(x=3e200, y=4e200).length() / 5e200, 1)
+        self.assertAlmostEqual(Vector2D(x=3e-200, y=4e-200).length() / 5e-200, 1)
 
     def test_to_cartesian(self):
         v = Vector2D(x=2, y=3)
         self.assertEqual(v.to_cartesian(), Vector2D(x=2, y=3))
         self.assertEqual(v.to_cartesian(), v)
+        self.assertIs(v.to_cartesian(), v)
         w = Vector2D(r=2, t=3)
         self.assertEqual(w.to_cartesian(), Vector2D(x=2*np.cos(3), y=2*np.sin(3)))
+        self.assertIs(w.to_cartesian(), w.to_cartesian())
 
     def test_to_polar(self):
         v = Vector2D(x=2, y=3)
@@ -45,6 +67,9 @@ class TestVector2D(TestCase):
         w = Vector2D(r=2, t=3)
         self.assertEqual(w.to_polar(), Vector2D(r=2, t=3))
         self.assertEqual(w.to_polar(), w)
+        self.assertIs(w.to_polar(), w)
+        p = v.to_polar()
+        self.assertEqual(p.to_cartesian(), Vector2D(r=p.r, t=p.t).to_cartesian())
 
     def test_neg(self):
         v = Vector2D(x=2, y=3)
@@ -105,6 +130,10 @@ class TestVector2D(TestCase):
         self.assertEqual(w.angle_with(z), 2)
         self.assertEqual(z.angle_with(w), 2)
         self.assertEqual(w.angle_with(u), 0.5*pi)
+        for x, y in [(0, 0), (-0.0, 0), (0, -0.0), (-0.0, -0.0)]:
+            zero = Vector2D(x=x, y=y)
+            self.assertEqual(zero.angle_with(Vector2D(x=1, y=0)), zero.to_polar().angle_with(Vector2D(x=1, y=0)))
+            self.assertEqual(zero.angle_with(Vector2D(x=1, y=0)), 0)
 
     def test_unit(self):
         v = Vector2D(x=3, y=3)
@@ -123,6 +152,7 @@ class TestVector2D(TestCase):
         self.assertEqual(v.rotate(pi), Vector2D(x=-3, y=-4))
         self.assertEqual(v.rotate(3*pi/2), Vector2D(x=4, y=-3))
         self.assertAlmostEqual((v.rotate(pi/4)-Vector2D(r=v.length(), t=(pi/4+np.arctan2(4, 3)) % tau)).length(), 0)
+        self.assertEqual(type(v.rotate(pi/4)), Vector2DCartesian)
         w = Vector2D(r=3, t=pi)
         self.assertEqual(w.rotate(0),  Vector2D(r=3, t=pi))
         self.assertEqual(w.rotate(3),  Vector2D(r=3, t=(pi+3) % tau))